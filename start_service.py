@@ -2,10 +2,18 @@
 """
 Startup script for the Math Solver FastAPI service
 """
+import functools
 import os
 import sys
 from pathlib import Path
 
+@functools.lru_cache(maxsize=1)
+def get_api_key():
+    """Load .env once and return OPENAI_API_KEY (None if unset)"""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return os.getenv("OPENAI_API_KEY")
+
 def check_environment():
     """Check if the environment is properly set up"""
     # Check if .env file exists
@@ -16,10 +24,7 @@ def check_environment():
         return False
     
     # Check if OPENAI_API_KEY is set
-    from dotenv import load_dotenv
-    load_dotenv()
-    
-    if not os.getenv("OPENAI_API_KEY"):
+    if not get_api_key():
         print("❌ OPENAI_API_KEY not found in .env file!")
         print("Please add your OpenAI API key to the .env file:")
         print("OPENAI_API_KEY=your_api_key_here")
@@ -45,7 +50,8 @@ def start_service():
         "math_solver_service:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,  # Auto-reload on code changes
+        # Auto-reload forks a file watcher and re-imports the app; dev only
+        reload=bool(os.getenv("DEV")),
         log_level="info"
     )
 